@@ -1,2 +1,2 @@
 # -*- coding: utf-8 -*-
-from . import controller, download, library, main, player, youtube
+from . import controller, download, library, main, player, youtube, zone
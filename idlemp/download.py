@@ -57,7 +57,8 @@ async def download_file(session: aiohttp.ClientSession, url: str,
 
 
 async def download(session: aiohttp.ClientSession, url: str,
-                   download_dir: pathlib.Path):
+                   download_dir: pathlib.Path,
+                   vlc_instance: vlc.Instance = None):
     parsedurl = urllib.parse.urlsplit(url)
     if parsedurl.netloc in YOUTUBE:
         # YouTube download
@@ -99,7 +100,8 @@ async def download(session: aiohttp.ClientSession, url: str,
                 length = int(tags['LENGTH'][0])
 
         if length is None:
-            vlc_instance = vlc.Instance()
+            if vlc_instance is None:
+                vlc_instance = vlc.Instance()
             if vlc_instance is not None:
                 media = vlc_instance.media_new(str(file_path))
                 media_length = media.get_duration()
@@ -122,7 +124,8 @@ async def download(session: aiohttp.ClientSession, url: str,
 
 async def download_task(download_path: pathlib.Path,
                         url_list_file: pathlib.Path, library: MusicLibrary,
-                        library_file: pathlib.Path):
+                        library_file: pathlib.Path,
+                        vlc_instance: vlc.Instance = None):
     async with aiohttp.ClientSession(raise_for_status=True) as session:
         while True:
             try:
@@ -136,7 +139,8 @@ async def download_task(download_path: pathlib.Path,
                     continue
 
                 # Download and get information
-                music = await download(session, url.strip(), download_path)
+                music = await download(session, url.strip(), download_path,
+                                       vlc_instance)
 
                 sync_task = None
 
@@ -53,6 +53,8 @@ class MusicLibrary:
 
     def get_random_with_max_len(self, max_length: int):
         eligible_musics = [m for m in self.musics if m.length <= max_length]
+        if not eligible_musics:
+            return None
         return random.choice(eligible_musics)
 
     def into_json(self, pretty=True):
@@ -22,10 +22,13 @@ import asyncio
 import logging
 import pathlib
 
+import vlc
+
 from .controller import AutoplayController
 from . import download
 from .library import MusicLibrary
 from .player import Player
+from .zone import Zone, ZoneInfo
 
 log_format = '[{asctime}] {levelname} {name}: {message}'
 logger = logging.getLogger(__name__)
@@ -95,52 +98,116 @@ def load_library(library_file: pathlib.Path):
         return MusicLibrary()
 
 
-def get_autoplay_controller(schedule_file: pathlib.Path):
+def get_autoplay_controller(schedule_file: pathlib.Path, zone_name: str,
+                            required: bool = False):
     if schedule_file.is_file():
-        logger.info('Found autoplay conditions file, loading')
+        logger.info(f'[{zone_name}] Found autoplay conditions file, loading')
         try:
             with schedule_file.open('r', encoding='utf-8') as file:
                 return AutoplayController.from_json(file.read())
         except Exception as e:
-            logger.critical(
-                f'Failed to load autoplay conditions from file: {e}')
+            logger.critical(f'[{zone_name}] Failed to load autoplay '
+                            f'conditions from file: {e}')
             raise e
+    elif required:
+        logger.critical(f'[{zone_name}] Autoplay conditions file '
+                        f'{schedule_file} not found')
+        raise FileNotFoundError(
+            f'Autoplay conditions file {schedule_file} not found')
     else:
-        logger.warning('Autoplay conditions file not found, always playing')
+        logger.warning(f'[{zone_name}] Autoplay conditions file not found, '
+                       f'always playing')
         return AutoplayController()
 
 
-def get_player():
+def get_player(vlc_instance: vlc.Instance, audio_output: str = None,
+               audio_device: str = None):
     try:
-        return Player()
+        return Player(vlc_instance, audio_output, audio_device)
     except Exception as e:
         logger.critical(f'Failed to get Player: {e}')
         raise e
 
 
-async def main_loop(settings: Settings, library: MusicLibrary,
-                    library_file: pathlib.Path,
-                    controller: AutoplayController, player: Player):
-    download_task = None
-    try:
-        if settings.url_list_file:
-            download_task = asyncio.create_task(
-                download.download_task(settings.library_path,
-                                       settings.url_list_file, library,
-                                       library_file))
+def get_vlc_instance():
+    vlc_instance = vlc.Instance()
+    if vlc_instance is None:
+        logger.critical('Failed to initialize VLC instance')
+        raise Exception('Failed to initialize VLC instance')
+    return vlc_instance
+
 
-        while True:
-            if controller.should_play():
+def load_zone_info(zones_file: pathlib.Path):
+    if zones_file.is_file():
+        logger.info('Found zones file, loading')
+        try:
+            with zones_file.open('r', encoding='utf-8') as file:
+                return ZoneInfo.from_json(file.read())
+        except Exception as e:
+            logger.critical(f'Failed to load zones from file: {e}')
+            raise e
+    else:
+        logger.info('Zones file not found, using a single zone')
+        return [ZoneInfo('default')]
+
+
+def get_zones(library_path: pathlib.Path, zone_info: [ZoneInfo],
+              vlc_instance: vlc.Instance):
+    zones = []
+    for info in zone_info:
+        # An explicitly configured schedule must exist, so that a mistyped
+        # path doesn't make the zone play around the clock
+        if info.schedule_file is not None:
+            controller = get_autoplay_controller(
+                library_path.joinpath(info.schedule_file), info.name,
+                required=True)
+        else:
+            controller = get_autoplay_controller(
+                library_path.joinpath('schedule.json'), info.name)
+        player = get_player(vlc_instance, info.audio_output,
+                            info.audio_device)
+        zones.append(Zone(info.name, controller, player))
+        logger.info(f'Zone {info.name} initialized successfully')
+    return zones
+
+
+async def zone_loop(settings: Settings, library: MusicLibrary, zone: Zone):
+    while True:
+        try:
+            if zone.controller.should_play():
                 music = library.get_random_with_max_len(
-                    controller.time_left().total_seconds())
+                    zone.controller.time_left().total_seconds())
                 if music is not None:
-                    logger.info(f'Playing {music.title} ({music.length})')
-                    await player.play(
+                    logger.info(f'[{zone.name}] Playing {music.title} '
+                                f'({music.length})')
+                    await zone.player.play(
                         str(settings.library_path.joinpath(music.file_name)))
                 else:
                     await asyncio.sleep(SLEEP_DELAY)
             else:
                 await asyncio.sleep(SLEEP_DELAY)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Don't let a failure in one zone stop the others
+            logger.error(f'[{zone.name}] Exception occured while playing: {e}')
+            await asyncio.sleep(SLEEP_DELAY)
+
+
+async def main_loop(settings: Settings, library: MusicLibrary,
+                    library_file: pathlib.Path, zones: [Zone],
+                    vlc_instance: vlc.Instance):
+    download_task = None
+    try:
+        # A single download task feeds the library shared by every zone
+        if settings.url_list_file:
+            download_task = asyncio.create_task(
+                download.download_task(settings.library_path,
+                                       settings.url_list_file, library,
+                                       library_file, vlc_instance))
+
+        await asyncio.gather(
+            *[zone_loop(settings, library, zone) for zone in zones])
     except (asyncio.CancelledError, KeyboardInterrupt, SystemExit):
         pass
 
@@ -168,17 +235,18 @@ def main(settings: Settings):
 
     logger.info('Library loaded successfully')
 
-    schedule_file = settings.library_path.joinpath('schedule.json')
-    controller = get_autoplay_controller(schedule_file)
-
-    logger.info('Autoplay conditions loaded successfully')
+    zones_file = settings.library_path.joinpath('zones.json')
+    zone_info = load_zone_info(zones_file)
 
-    player = get_player()
+    vlc_instance = get_vlc_instance()
 
     logger.info('VLC was initialized successfully')
 
+    zones = get_zones(settings.library_path, zone_info, vlc_instance)
+
     logger.info('Starting main loop')
-    asyncio.run(main_loop(settings, library, library_file, controller, player))
+    asyncio.run(main_loop(settings, library, library_file, zones,
+                          vlc_instance))
 
 
 if __name__ == '__main__':
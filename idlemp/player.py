@@ -27,8 +27,13 @@ INITIAL_WAIT = 5
 
 
 class Player:
-    def __init__(self):
-        self.vlc_instance = vlc.Instance()
+    def __init__(self, vlc_instance: vlc.Instance = None,
+                 audio_output: str = None, audio_device: str = None):
+        # Players can share a VLC instance, so that each additional one only
+        # costs a MediaPlayer
+        if vlc_instance is None:
+            vlc_instance = vlc.Instance()
+        self.vlc_instance = vlc_instance
         if self.vlc_instance is None:
             raise Exception('Failed to initialize VLC instance')
 
@@ -36,6 +41,18 @@ class Player:
         if self.mediaplayer is None:
             raise Exception('Failed to initialize VLC MediaPlayer')
 
+        if audio_output is not None:
+            if self.mediaplayer.audio_output_set(audio_output) != 0:
+                raise Exception(
+                    f'Failed to set audio output module {audio_output}')
+
+        if audio_device is not None:
+            if audio_output is None:
+                raise Exception('An audio output module is required to set '
+                                'the audio device')
+            self.mediaplayer.audio_output_device_set(audio_output,
+                                                     audio_device)
+
     async def play(self, path: str):
         logger.info(f'Playing file {path}')
 
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#   Copyright © 2019 Joaquim Monteiro
+#
+#   This file is part of Idle Music Player.
+#
+#   Idle Music Player is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   Idle Music Player is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with Idle Music Player.  If not, see <https://www.gnu.org/licenses/>
+
+import json
+
+from .controller import AutoplayController
+from .player import Player
+
+
+class ZoneInfo:
+    def __init__(self, name: str, schedule_file: str = None,
+                 audio_output: str = None, audio_device: str = None):
+        # libvlc only applies a device without a module to an audio output
+        # that is already active, so it would be silently ignored
+        if audio_device is not None and audio_output is None:
+            raise ValueError(f'zone {name} sets audio_device without '
+                             f'audio_output')
+
+        self.name = name
+        self.schedule_file = schedule_file
+        self.audio_output = audio_output
+        self.audio_device = audio_device
+
+    @staticmethod
+    def from_json(json_data):
+        data = json.loads(json_data)
+        if not isinstance(data, list):
+            raise ValueError('zones must be a list')
+
+        zones = [ZoneInfo(o['name'], o.get('schedule'),
+                          o.get('audio_output'), o.get('audio_device'))
+                 for o in data]
+
+        names = [zone.name for zone in zones]
+        if len(set(names)) != len(names):
+            raise ValueError('zone names must be unique')
+        if not zones:
+            raise ValueError('at least one zone must be configured')
+
+        return zones
+
+
+class Zone:
+    def __init__(self, name: str, controller: AutoplayController,
+                 player: Player):
+        self.name = name
+        self.controller = controller
+        self.player = player